@@ -17,6 +17,7 @@ All functionality is implemented in Python using Panel's reactive framework.
 import logging
 import os
 import sys
+from html import escape
 from pathlib import Path
 
 import panel as pn
@@ -25,20 +26,14 @@ import panel as pn
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # Import dashboard components
+from dashboard.logging_config import setup_logging
 from dashboard.views import create_dashboard
 
 # Configure Panel
 pn.extension("bokeh", "tabulator", template="material", sizing_mode="stretch_width")
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler("dashboard.log", encoding="utf-8"),
-    ],
-)
+# Configure logging (a no-op on the per-session re-runs under panel serve)
+setup_logging("dashboard.log")
 logger = logging.getLogger(__name__)
 
 
@@ -88,7 +83,7 @@ def main():
     # Check if database exists
     if not Path(db_path).exists():
         logger.warning(
-            f"Database not found at {db_path}. You'll need to run analysis first."
+            "Database not found at %s. You'll need to run analysis first.", db_path
         )
 
     # Create the main dashboard
@@ -108,7 +103,7 @@ def main():
         return app
 
     except Exception as e:
-        logger.error(f"Error creating dashboard: {e}")
+        logger.error("Error creating dashboard: %s", e)
 
         # Return error page
         error_page = pn.Column(
@@ -117,10 +112,10 @@ def main():
                 f"""
             <div style="background: #f8d7da; color: #721c24; padding: 20px; border-radius: 8px; border: 1px solid #f5c6cb;">
                 <h3>⚠️ Dashboard Error</h3>
-                <p><strong>Error:</strong> {e}</p>
+                <p><strong>Error:</strong> {escape(str(e))}</p>
                 <p><strong>Possible solutions:</strong></p>
                 <ul>
-                    <li>Make sure the database file exists: <code>{db_path}</code></li>
+                    <li>Make sure the database file exists: <code>{escape(db_path)}</code></li>
                     <li>Run the analysis first using the Analysis tab</li>
                     <li>Check the logs for more details</li>
                     <li>Verify all dependencies are installed: <code>pip install -r requirements.txt</code></li>
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Dashboard Logging Configuration
+
+Routes all root logging through a queue that a background QueueListener
+drains, so Panel callbacks never block on console or file writes.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+
+def setup_logging(log_file: str = "dashboard.log") -> Optional[QueueListener]:
+    """
+    Install a QueueHandler on the root logger and start its listener.
+
+    Handlers already on the root logger (e.g. the one ``panel serve`` adds
+    through Bokeh's logconfig) are moved behind the queue alongside the log
+    file handler, keeping their own formatting. The setup runs only once per
+    process; later calls, such as the per-session re-runs of app.py under
+    ``panel serve``, return None.
+    """
+    root = logging.getLogger()
+    if any(isinstance(handler, QueueHandler) for handler in root.handlers):
+        return None
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers = list(root.handlers)
+    if not handlers:
+        # Nothing configured yet (e.g. direct execution); log to the console too
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        handlers.append(console_handler)
+        root.setLevel(logging.INFO)
+
+    file_handler = logging.FileHandler(log_file, encoding="utf-8")
+    file_handler.setFormatter(formatter)
+    handlers.append(file_handler)
+
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    # The QueueHandler only merges message arguments and tracebacks into the
+    # record; each listener handler applies its own format when writing.
+    root.addHandler(QueueHandler(log_queue))
+    return listener
@@ -10,31 +10,25 @@ All UI components are built using Python only - no JavaScript required.
 """
 
 import logging
+from functools import lru_cache
+from html import escape
 
 # Import our models and database
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Dict, List
 
 import pandas as pd
 import panel as pn
 import param
-from bokeh.models import ColumnDataSource, HoverTool
+from bokeh.models import HoverTool
 from bokeh.palettes import Category20
 from bokeh.plotting import figure
-from bokeh.transform import factor_cmap
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from db.queries import DatabaseQuerier
 
-from models.types import (
-    AnalysisConfigForm,
-    ComplexityLevel,
-    DomainType,
-    FileFilterForm,
-    FileType,
-    SystemStats,
-)
+from models.types import ComplexityLevel, DomainType, FileType
 
 # Configure Panel
 pn.extension("bokeh", "tabulator", template="material")
@@ -42,6 +36,72 @@ pn.extension("bokeh", "tabulator", template="material")
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Column order of the file explorer table
+FILE_TABLE_COLUMNS = [
+    "id",
+    "name",
+    "path",
+    "domain",
+    "file_type",
+    "complexity",
+    "complexity_level",
+    "lines_of_code",
+    "classes_count",
+    "functions_count",
+    "imports_count",
+    "pydantic_models_count",
+]
+
+# Chart palettes, resolved once at import rather than on every chart build
+DOMAIN_PALETTE = Category20[20]
+COMPLEXITY_COLORS = {  # Green to Red, keyed by complexity label
+    "Low": "#28a745",
+    "Medium": "#ffc107",
+    "High": "#fd7e14",
+    "Very High": "#dc3545",
+}
+UNKNOWN_COMPLEXITY_COLOR = "#6c757d"
+
+# Overview statistic card, filled in once per card
+STAT_CARD_TEMPLATE = """
+        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid {color};">
+            <h3 style="margin: 0; color: {color};">{value:,}</h3>
+            <p style="margin: 5px 0 0 0; color: #6c757d;">{label}</p>
+        </div>
+        """
+
+# Single search result entry
+RESULT_ITEM_TEMPLATE = (
+    "<li><strong>{name}</strong> - {path}<br><small>{details}</small></li>"
+)
+
+
+def format_label(value) -> str:
+    """Turn an enum member or raw value like 'very_high' into 'Very High'."""
+    return str(getattr(value, "value", value)).replace("_", " ").title()
+
+
+def _db_revision(db_path: str) -> tuple:
+    """Identify the current state of a SQLite file without querying it.
+
+    The header's file change counter (bytes 24-27) is bumped by every
+    committed write, so edits within one mtime tick are still detected.
+    """
+    db_stat = Path(db_path).stat()
+    with open(db_path, "rb") as f:
+        header = f.read(28)
+    return db_stat.st_mtime_ns, db_stat.st_size, header[24:28]
+
+
+@lru_cache(maxsize=8)
+def _load_system_stats(db_path: str, revision: tuple):
+    """Load system statistics, shared across sessions until the file changes.
+
+    ``revision`` comes from _db_revision and only serves as part of the
+    cache key, so any committed write invalidates the cached entry.
+    """
+    return DatabaseQuerier(db_path).get_system_stats()
+
 
 class DashboardState(param.Parameterized):
     """Central state management for the dashboard."""
@@ -72,9 +132,10 @@ class DashboardState(param.Parameterized):
     def refresh_system_stats(self):
         """Refresh system statistics from database."""
         try:
-            self.system_stats = self.db_querier.get_system_stats()
+            db_path = self.db_querier.db_path
+            self.system_stats = _load_system_stats(db_path, _db_revision(db_path))
         except Exception as e:
-            logger.error(f"Error refreshing system stats: {e}")
+            logger.error("Error refreshing system stats: %s", e)
             self.system_stats = None
 
 
@@ -210,26 +271,28 @@ class FileExplorer(param.Parameterized):
 
     def files_to_dataframe(self, files: List) -> pd.DataFrame:
         """Convert file records to DataFrame."""
-        data = []
-        for file in files:
-            data.append(
-                {
-                    "id": file.id,
-                    "name": file.name,
-                    "path": file.path,
-                    "domain": file.domain.value,
-                    "file_type": file.file_type.value,
-                    "complexity": file.complexity,
-                    "complexity_level": file.complexity_level.value,
-                    "lines_of_code": file.lines_of_code,
-                    "classes_count": file.classes_count,
-                    "functions_count": file.functions_count,
-                    "imports_count": file.imports_count,
-                    "pydantic_models_count": file.pydantic_models_count,
-                }
+        # Build plain row tuples and let pandas assemble the columns in one go,
+        # rather than allocating a keyed dict per file. Enum fields may already
+        # be plain strings because the models use use_enum_values.
+        rows = [
+            (
+                file.id,
+                file.name,
+                file.path,
+                getattr(file.domain, "value", file.domain),
+                getattr(file.file_type, "value", file.file_type),
+                file.complexity,
+                getattr(file.complexity_level, "value", file.complexity_level),
+                file.lines_of_code,
+                file.classes_count,
+                file.functions_count,
+                file.imports_count,
+                file.pydantic_models_count,
             )
+            for file in files
+        ]
 
-        return pd.DataFrame(data)
+        return pd.DataFrame.from_records(rows, columns=FILE_TABLE_COLUMNS)
 
     def apply_filters(
         self, domain, file_type, complexity_level, min_lines, max_lines, search_term
@@ -268,10 +331,10 @@ class FileExplorer(param.Parameterized):
                 "search_term": search_term,
             }
 
-            logger.info(f"Applied filters, found {len(files)} files")
+            logger.info("Applied filters, found %d files", len(files))
 
         except Exception as e:
-            logger.error(f"Error applying filters: {e}")
+            logger.error("Error applying filters: %s", e)
             pn.state.notifications.error(f"Error applying filters: {e}")
 
     def clear_filters(self, *widgets):
@@ -293,7 +356,7 @@ class FileExplorer(param.Parameterized):
             logger.info("Filters cleared")
 
         except Exception as e:
-            logger.error(f"Error clearing filters: {e}")
+            logger.error("Error clearing filters: %s", e)
             pn.state.notifications.error(f"Error clearing filters: {e}")
 
     def on_file_selected(self, event):
@@ -302,7 +365,7 @@ class FileExplorer(param.Parameterized):
             selected_row = event.new[0]
             file_id = self.files_table.value.iloc[selected_row]["id"]
             self.state.selected_file_id = file_id
-            logger.info(f"Selected file ID: {file_id}")
+            logger.info("Selected file ID: %s", file_id)
 
     def view(self) -> pn.Column:
         """Return the complete file explorer view."""
@@ -326,52 +389,22 @@ class StatisticsPanel(param.Parameterized):
 
         stats = self.state.system_stats
 
-        files_card = pn.pane.HTML(
-            f"""
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid #007bff;">
-            <h3 style="margin: 0; color: #007bff;">{stats.total_files:,}</h3>
-            <p style="margin: 5px 0 0 0; color: #6c757d;">Total Files</p>
-        </div>
-        """,
-            width=200,
-            height=100,
-        )
-
-        classes_card = pn.pane.HTML(
-            f"""
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid #28a745;">
-            <h3 style="margin: 0; color: #28a745;">{stats.total_classes:,}</h3>
-            <p style="margin: 5px 0 0 0; color: #6c757d;">Total Classes</p>
-        </div>
-        """,
-            width=200,
-            height=100,
-        )
-
-        functions_card = pn.pane.HTML(
-            f"""
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid #ffc107;">
-            <h3 style="margin: 0; color: #ffc107;">{stats.total_functions:,}</h3>
-            <p style="margin: 5px 0 0 0; color: #6c757d;">Total Functions</p>
-        </div>
-        """,
-            width=200,
-            height=100,
-        )
-
-        lines_card = pn.pane.HTML(
-            f"""
-        <div style="background: #f8f9fa; padding: 20px; border-radius: 8px; text-align: center; border-left: 4px solid #dc3545;">
-            <h3 style="margin: 0; color: #dc3545;">{stats.total_lines:,}</h3>
-            <p style="margin: 5px 0 0 0; color: #6c757d;">Lines of Code</p>
-        </div>
-        """,
-            width=200,
-            height=100,
+        return pn.Row(
+            *(
+                pn.pane.HTML(
+                    STAT_CARD_TEMPLATE.format(value=value, label=label, color=color),
+                    width=200,
+                    height=100,
+                )
+                for value, label, color in (
+                    (stats.total_files, "Total Files", "#007bff"),
+                    (stats.total_classes, "Total Classes", "#28a745"),
+                    (stats.total_functions, "Total Functions", "#ffc107"),
+                    (stats.total_lines, "Lines of Code", "#dc3545"),
+                )
+            )
         )
 
-        return pn.Row(files_card, classes_card, functions_card, lines_card)
-
     def create_domain_chart(self) -> pn.pane.Bokeh:
         """Create domain distribution chart."""
         if not self.state.system_stats or not self.state.system_stats.domains:
@@ -380,7 +413,7 @@ class StatisticsPanel(param.Parameterized):
         domains = self.state.system_stats.domains
 
         # Prepare data
-        domain_names = [d.domain.value.replace("_", " ").title() for d in domains]
+        domain_names = [format_label(d.domain) for d in domains]
         file_counts = [d.files_count for d in domains]
 
         # Create figure
@@ -393,14 +426,11 @@ class StatisticsPanel(param.Parameterized):
         )
 
         # Add bars
-        colors = (
-            Category20[len(domain_names)] if len(domain_names) <= 20 else Category20[20]
-        )
         p.vbar(
             x=domain_names,
             top=file_counts,
             width=0.8,
-            color=colors[: len(domain_names)],
+            color=DOMAIN_PALETTE[: len(domain_names)],
             alpha=0.8,
         )
 
@@ -440,12 +470,14 @@ class StatisticsPanel(param.Parameterized):
         )
 
         # Add bars with color mapping
-        colors = ["#28a745", "#ffc107", "#fd7e14", "#dc3545"]  # Green to Red
         p.vbar(
             x=complexity_levels,
             top=counts,
             width=0.8,
-            color=colors[: len(complexity_levels)],
+            color=[
+                COMPLEXITY_COLORS.get(level, UNKNOWN_COMPLEXITY_COLOR)
+                for level in complexity_levels
+            ],
             alpha=0.8,
         )
 
@@ -483,6 +515,8 @@ class SearchPanel(param.Parameterized):
     def __init__(self, state: DashboardState, **params):
         super().__init__(state=state, **params)
         self.search_input = None
+        self.results_header = None
+        self.results_pane = None
         self.results_panel = None
         self.setup_components()
 
@@ -500,11 +534,16 @@ class SearchPanel(param.Parameterized):
         search_button.on_click(self.perform_search)
         self.search_input.param.watch(self.on_search_enter, "value")
 
+        # A single header and results pane are reused for every search; only
+        # their contents are swapped, so no new Bokeh models are created.
+        self.results_header = pn.pane.Markdown("### Search Results")
+        self.results_pane = pn.pane.HTML(
+            "<p>Enter a search term to find files, classes, and functions.</p>",
+            sizing_mode="stretch_width",
+        )
         self.results_panel = pn.Column(
-            "### Search Results",
-            pn.pane.HTML(
-                "<p>Enter a search term to find files, classes, and functions.</p>"
-            ),
+            self.results_header,
+            self.results_pane,
             sizing_mode="stretch_width",
         )
 
@@ -520,9 +559,7 @@ class SearchPanel(param.Parameterized):
         search_term = self.search_input.value.strip()
 
         if not search_term or len(search_term) < 2:
-            self.results_panel[1] = pn.pane.HTML(
-                "<p>Please enter at least 2 characters to search.</p>"
-            )
+            self.show_message("<p>Please enter at least 2 characters to search.</p>")
             return
 
         try:
@@ -535,58 +572,55 @@ class SearchPanel(param.Parameterized):
             self.update_results_display(results, search_term)
 
             logger.info(
-                f"Search completed for '{search_term}', found {sum(len(v) for v in results.values())} results"
+                "Search completed for '%s', found %d results",
+                search_term,
+                sum(len(v) for v in results.values()),
             )
 
         except Exception as e:
-            logger.error(f"Search error: {e}")
-            self.results_panel[1] = pn.pane.HTML(
-                f"<p style='color: red;'>Search error: {e}</p>"
+            logger.error("Search error: %s", e)
+            self.show_message(
+                f"<p style='color: red;'>Search error: {escape(str(e))}</p>"
             )
 
+    def show_message(self, html: str):
+        """Replace the search results with a single message."""
+        self.results_header.object = "### Search Results"
+        self.results_pane.object = html
+
     def update_results_display(self, results: Dict[str, List], search_term: str):
         """Update the results display."""
         total_results = sum(len(v) for v in results.values())
 
         if total_results == 0:
-            self.results_panel[1] = pn.pane.HTML(
-                f"<p>No results found for '{search_term}'.</p>"
-            )
+            self.show_message(f"<p>No results found for '{escape(search_term)}'.</p>")
             return
 
-        # Create results sections
-        sections = []
-
-        # Files section
-        if results["files"]:
-            files_html = f"<h4>Files ({len(results['files'])})</h4><ul>"
-            for item in results["files"][:10]:  # Limit to 10 items per section
-                files_html += f"<li><strong>{item['name']}</strong> - {item['path']}<br><small>{item['details']}</small></li>"
-            files_html += "</ul>"
-            sections.append(pn.pane.HTML(files_html))
-
-        # Classes section
-        if results["classes"]:
-            classes_html = f"<h4>Classes ({len(results['classes'])})</h4><ul>"
-            for item in results["classes"][:10]:
-                classes_html += f"<li><strong>{item['name']}</strong> - {item['path']}<br><small>{item['details']}</small></li>"
-            classes_html += "</ul>"
-            sections.append(pn.pane.HTML(classes_html))
-
-        # Functions section
-        if results["functions"]:
-            functions_html = f"<h4>Functions ({len(results['functions'])})</h4><ul>"
-            for item in results["functions"][:10]:
-                functions_html += f"<li><strong>{item['name']}</strong> - {item['path']}<br><small>{item['details']}</small></li>"
-            functions_html += "</ul>"
-            sections.append(pn.pane.HTML(functions_html))
+        # Create results sections, limited to 10 items per section
+        sections = [
+            f"<h4>{title} ({len(results[key])})</h4><ul>"
+            + "".join(
+                RESULT_ITEM_TEMPLATE.format(
+                    name=escape(item["name"]),
+                    path=escape(item["path"]),
+                    details=escape(item["details"]),
+                )
+                for item in results[key][:10]
+            )
+            + "</ul>"
+            for key, title in (
+                ("files", "Files"),
+                ("classes", "Classes"),
+                ("functions", "Functions"),
+            )
+            if results[key]
+        ]
 
         # Update results panel
-        self.results_panel.clear()
-        self.results_panel.append(
-            f"### Search Results for '{search_term}' ({total_results} total)"
+        self.results_header.object = (
+            f"### Search Results for '{escape(search_term)}' ({total_results} total)"
         )
-        self.results_panel.extend(sections)
+        self.results_pane.object = "".join(sections)
 
     def view(self) -> pn.Column:
         """Return the complete search panel."""
@@ -657,7 +691,7 @@ class AnalysisConfigPanel(param.Parameterized):
             # Validate inputs
             project_root = Path(self.project_root_input.value)
             if not project_root.exists():
-                self.status_panel.object = f"<p style='color: red;'>Error: Project root does not exist: {project_root}</p>"
+                self.status_panel.object = f"<p style='color: red;'>Error: Project root does not exist: {escape(str(project_root))}</p>"
                 return
 
             # Parse patterns
@@ -694,8 +728,10 @@ class AnalysisConfigPanel(param.Parameterized):
             logger.info("Analysis completed successfully")
 
         except Exception as e:
-            logger.error(f"Analysis error: {e}")
-            self.status_panel.object = f"<p style='color: red;'>Analysis error: {e}</p>"
+            logger.error("Analysis error: %s", e)
+            self.status_panel.object = (
+                f"<p style='color: red;'>Analysis error: {escape(str(e))}</p>"
+            )
 
         finally:
             self.run_button.disabled = False
@@ -44,6 +44,22 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Function types that are bound to an enclosing class
+METHOD_FUNCTION_TYPES = frozenset({"method", "staticmethod", "classmethod", "property"})
+
+# File type for each known (lower-cased) extension; anything else is OTHER
+FILE_TYPE_BY_SUFFIX = {
+    ".py": FileType.PYTHON,
+    ".js": FileType.JAVASCRIPT,
+    ".html": FileType.HTML,
+    ".css": FileType.CSS,
+    ".md": FileType.MARKDOWN,
+    ".markdown": FileType.MARKDOWN,
+    ".json": FileType.JSON,
+    ".yml": FileType.YAML,
+    ".yaml": FileType.YAML,
+}
+
 
 class ASTAnalyzer:
     """Analyzes Python files using AST to extract code structure."""
@@ -51,6 +67,8 @@ class ASTAnalyzer:
     def __init__(self):
         self.current_file_path = ""
         self.current_file_id = None
+        # Resolved once; every extracted entity is made relative to it
+        self.cwd = Path.cwd()
 
     def analyze_file(
         self, file_path: Path
@@ -75,6 +93,9 @@ class ASTAnalyzer:
             functions = []
             relationships = []
 
+            # Collect methods once so top-level checks are a set lookup
+            method_nodes = self._collect_method_nodes(tree)
+
             for node in ast.walk(tree):
                 if isinstance(node, ast.ClassDef):
                     class_record = self._extract_class_info(node, file_path)
@@ -92,7 +113,7 @@ class ASTAnalyzer:
 
                 elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
                     # Only top-level functions (not methods)
-                    if self._is_top_level_function(node, tree):
+                    if node not in method_nodes:
                         function_record = self._extract_function_info(node, file_path)
                         functions.append(function_record)
 
@@ -102,7 +123,7 @@ class ASTAnalyzer:
             return file_record, classes, functions, relationships
 
         except Exception as e:
-            logger.error(f"Error analyzing file {file_path}: {e}")
+            logger.error("Error analyzing file %s: %s", file_path, e)
             # Return minimal file record on error
             file_record = FileRecord(
                 name=file_path.name,
@@ -121,7 +142,7 @@ class ASTAnalyzer:
     def _get_relative_path(self, file_path: Path) -> str:
         """Get relative path, handling cases where file is outside current directory."""
         try:
-            return str(file_path.relative_to(Path.cwd())).replace("\\", "/")
+            return str(file_path.relative_to(self.cwd)).replace("\\", "/")
         except ValueError:
             # File is outside current directory, use just the filename
             return file_path.name
@@ -145,20 +166,18 @@ class ASTAnalyzer:
         self, file_path: Path, content: str, tree: ast.AST
     ) -> FileRecord:
         """Extract file-level information."""
-        lines = content.split("\n")
-
-        # Count different types of nodes
-        classes_count = len([n for n in ast.walk(tree) if isinstance(n, ast.ClassDef)])
-        functions_count = len(
-            [
-                n
-                for n in ast.walk(tree)
-                if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-            ]
-        )
-        imports_count = len(
-            [n for n in ast.walk(tree) if isinstance(n, (ast.Import, ast.ImportFrom))]
-        )
+        # Count lines without materializing a list of line strings
+        lines_of_code = content.count("\n") + 1
+
+        # Count different types of nodes in a single walk of the tree
+        classes_count = functions_count = imports_count = 0
+        for node in ast.walk(tree):
+            if isinstance(node, ast.ClassDef):
+                classes_count += 1
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                functions_count += 1
+            elif isinstance(node, (ast.Import, ast.ImportFrom)):
+                imports_count += 1
 
         # Count Pydantic models
         pydantic_models_count = self._count_pydantic_models(tree)
@@ -172,7 +191,7 @@ class ASTAnalyzer:
             domain=self._classify_domain(file_path),
             file_type=self._classify_file_type(file_path),
             complexity=complexity,
-            lines_of_code=len(lines),
+            lines_of_code=lines_of_code,
             classes_count=classes_count,
             functions_count=functions_count,
             imports_count=imports_count,
@@ -182,12 +201,8 @@ class ASTAnalyzer:
     def _extract_class_info(self, node: ast.ClassDef, file_path: Path) -> ClassRecord:
         """Extract information about a class."""
         # Count methods
-        methods_count = len(
-            [
-                n
-                for n in node.body
-                if isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef))
-            ]
+        methods_count = sum(
+            isinstance(n, (ast.FunctionDef, ast.AsyncFunctionDef)) for n in node.body
         )
 
         # Extract base classes
@@ -347,31 +362,16 @@ class ASTAnalyzer:
         """Classify the file type based on extension."""
         suffix = file_path.suffix.lower()
 
-        if suffix == ".py":
-            return FileType.PYTHON
-        elif suffix == ".js":
-            return FileType.JAVASCRIPT
-        elif suffix == ".html":
-            return FileType.HTML
-        elif suffix == ".css":
-            return FileType.CSS
-        elif suffix in [".md", ".markdown"]:
-            return FileType.MARKDOWN
-        elif suffix == ".json":
-            return FileType.JSON
-        elif suffix in [".yml", ".yaml"]:
-            return FileType.YAML
-        else:
-            return FileType.OTHER
+        return FILE_TYPE_BY_SUFFIX.get(suffix, FileType.OTHER)
 
     def _count_pydantic_models(self, tree: ast.AST) -> int:
         """Count Pydantic models in the AST."""
         count = 0
         for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                base_classes = [self._get_name(base) for base in node.bases]
-                if any("BaseModel" in base for base in base_classes):
-                    count += 1
+            if isinstance(node, ast.ClassDef) and any(
+                "BaseModel" in self._get_name(base) for base in node.bases
+            ):
+                count += 1
         return count
 
     def _calculate_complexity(self, tree: ast.AST) -> int:
@@ -404,15 +404,14 @@ class ASTAnalyzer:
 
         return complexity
 
-    def _is_top_level_function(
-        self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef], tree: ast.AST
-    ) -> bool:
-        """Check if a function is defined at the top level (not inside a class)."""
-        for parent in ast.walk(tree):
-            if isinstance(parent, ast.ClassDef):
-                if node in parent.body:
-                    return False
-        return True
+    def _collect_method_nodes(self, tree: ast.AST) -> Set[ast.AST]:
+        """Collect nodes defined directly in a class body (i.e. methods)."""
+        return {
+            item
+            for parent in ast.walk(tree)
+            if isinstance(parent, ast.ClassDef)
+            for item in parent.body
+        }
 
     def _is_generator(self, node: Union[ast.FunctionDef, ast.AsyncFunctionDef]) -> bool:
         """Check if a function is a generator (contains yield)."""
@@ -604,7 +603,7 @@ class DatabasePopulator:
                 "*.egg-info",
             ]
 
-        logger.info(f"Starting analysis of project: {project_root}")
+        logger.info("Starting analysis of project: %s", project_root)
 
         # Clear existing data
         self._clear_database()
@@ -613,7 +612,7 @@ class DatabasePopulator:
         files_to_analyze = self._find_files(
             project_root, include_patterns, exclude_patterns
         )
-        logger.info(f"Found {len(files_to_analyze)} files to analyze")
+        logger.info("Found %d files to analyze", len(files_to_analyze))
 
         # Analyze each file
         with sqlite3.connect(self.db_path) as conn:
@@ -623,7 +622,7 @@ class DatabasePopulator:
                 try:
                     self._analyze_and_store_file(cursor, file_path, project_root)
                 except Exception as e:
-                    logger.error(f"Error processing file {file_path}: {e}")
+                    logger.error("Error processing file %s: %s", file_path, e)
                     continue
 
             conn.commit()
@@ -704,12 +703,7 @@ class DatabasePopulator:
         for function_record in functions:
             function_record.file_id = file_id
             # Set class_id if this is a method
-            if function_record.function_type in [
-                "method",
-                "staticmethod",
-                "classmethod",
-                "property",
-            ]:
+            if function_record.function_type in METHOD_FUNCTION_TYPES:
                 # Find the class this method belongs to
                 for class_name, class_id in class_id_map.items():
                     if function_record.file_path == file_record.path:
@@ -719,17 +713,16 @@ class DatabasePopulator:
             self._insert_function_record(cursor, function_record)
 
         # Insert relationships (will be resolved in a second pass)
-        for relationship_record in relationships:
-            self._insert_relationship_record(cursor, relationship_record)
+        self._insert_relationship_records(cursor, relationships)
 
     def _basic_file_analysis(self, file_path: Path, project_root: Path) -> FileRecord:
         """Perform basic analysis for non-Python files."""
         try:
             with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
                 content = f.read()
-                lines = content.split("\n")
+            lines_of_code = content.count("\n") + 1
         except Exception:
-            lines = []
+            lines_of_code = 0
 
         return FileRecord(
             name=file_path.name,
@@ -737,7 +730,7 @@ class DatabasePopulator:
             domain=self.analyzer._classify_domain(file_path),
             file_type=self.analyzer._classify_file_type(file_path),
             complexity=0,
-            lines_of_code=len(lines),
+            lines_of_code=lines_of_code,
             classes_count=0,
             functions_count=0,
             imports_count=0,
@@ -841,11 +834,11 @@ class DatabasePopulator:
         )
         return cursor.lastrowid
 
-    def _insert_relationship_record(
-        self, cursor: sqlite3.Cursor, record: RelationshipRecord
-    ) -> int:
-        """Insert a relationship record and return its ID."""
-        cursor.execute(
+    def _insert_relationship_records(
+        self, cursor: sqlite3.Cursor, records: List[RelationshipRecord]
+    ):
+        """Insert many relationship records in a single executemany call."""
+        cursor.executemany(
             """
             INSERT INTO relationships (
                 source_type, source_id, source_name, target_type, target_id,
@@ -853,22 +846,24 @@ class DatabasePopulator:
             ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
             (
-                record.source_type,
-                record.source_id,
-                record.source_name,
-                record.target_type,
-                record.target_id,
-                record.target_name,
                 (
-                    record.relationship_type.value
-                    if hasattr(record.relationship_type, "value")
-                    else record.relationship_type
-                ),
-                record.file_path,
-                record.line_number,
+                    record.source_type,
+                    record.source_id,
+                    record.source_name,
+                    record.target_type,
+                    record.target_id,
+                    record.target_name,
+                    (
+                        record.relationship_type.value
+                        if hasattr(record.relationship_type, "value")
+                        else record.relationship_type
+                    ),
+                    record.file_path,
+                    record.line_number,
+                )
+                for record in records
             ),
         )
-        return cursor.lastrowid
 
 
 def main():
@@ -897,14 +892,14 @@ def main():
 
     project_root = Path(args.project_root)
     if not project_root.exists():
-        logger.error(f"Project root does not exist: {project_root}")
+        logger.error("Project root does not exist: %s", project_root)
         sys.exit(1)
 
     populator = DatabasePopulator(args.db_path)
     populator.create_tables()
     populator.populate_from_directory(project_root, args.include, args.exclude)
 
-    logger.info(f"Database population completed. Database saved to: {args.db_path}")
+    logger.info("Database population completed. Database saved to: %s", args.db_path)
 
 
 if __name__ == "__main__":
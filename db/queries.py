@@ -393,7 +393,7 @@ class DatabaseQuerier:
         with self.get_connection() as conn:
             cursor = conn.cursor()
 
-            # Get overall statistics
+            # Get overall statistics and last analysis timestamp in one pass
             cursor.execute(
                 """
                 SELECT 
@@ -401,7 +401,8 @@ class DatabaseQuerier:
                     SUM(classes_count) as total_classes,
                     SUM(functions_count) as total_functions,
                     SUM(lines_of_code) as total_lines,
-                    AVG(complexity) as avg_complexity
+                    AVG(complexity) as avg_complexity,
+                    MAX(created_at) as last_analysis
                 FROM files
             """
             )
@@ -470,13 +471,13 @@ class DatabaseQuerier:
                     )
                 )
 
-            # Get last analysis timestamp
-            cursor.execute("SELECT MAX(created_at) FROM files")
-            last_analysis_row = cursor.fetchone()
+            # Parse last analysis timestamp
             last_analysis = None
-            if last_analysis_row[0]:
+            if overall_stats["last_analysis"]:
                 try:
-                    last_analysis = datetime.fromisoformat(last_analysis_row[0])
+                    last_analysis = datetime.fromisoformat(
+                        overall_stats["last_analysis"]
+                    )
                 except:
                     pass
 
@@ -647,17 +648,21 @@ class DatabaseQuerier:
 
         return results
 
-    # Helper methods for converting database rows to Pydantic models
+    # Helper methods for converting database rows to Pydantic models.
+    # Rows come from tables written by DatabasePopulator from already validated
+    # records, so they are built with model_construct to skip re-validation.
+    # Enum columns are passed as their stored string values, matching what
+    # validation would produce under the models' use_enum_values config.
     def _row_to_file_record(self, row: sqlite3.Row) -> FileRecord:
         """Convert database row to FileRecord."""
-        return FileRecord(
+        return FileRecord.model_construct(
             id=row["id"],
             name=row["name"],
             path=row["path"],
-            domain=DomainType(row["domain"]),
-            file_type=FileType(row["file_type"]),
+            domain=row["domain"],
+            file_type=row["file_type"],
             complexity=row["complexity"],
-            complexity_level=ComplexityLevel(row["complexity_level"]),
+            complexity_level=row["complexity_level"],
             lines_of_code=row["lines_of_code"],
             classes_count=row["classes_count"],
             functions_count=row["functions_count"],
@@ -673,12 +678,12 @@ class DatabaseQuerier:
 
     def _row_to_class_record(self, row: sqlite3.Row) -> ClassRecord:
         """Convert database row to ClassRecord."""
-        return ClassRecord(
+        return ClassRecord.model_construct(
             id=row["id"],
             name=row["name"],
             file_id=row["file_id"],
             file_path=row["file_path"],
-            domain=DomainType(row["domain"]),
+            domain=row["domain"],
             class_type=row["class_type"],
             line_number=row["line_number"],
             methods_count=row["methods_count"],
@@ -696,7 +701,7 @@ class DatabaseQuerier:
 
     def _row_to_function_record(self, row: sqlite3.Row) -> FunctionRecord:
         """Convert database row to FunctionRecord."""
-        return FunctionRecord(
+        return FunctionRecord.model_construct(
             id=row["id"],
             name=row["name"],
             file_id=row["file_id"],
@@ -721,7 +726,7 @@ class DatabaseQuerier:
 
     def _row_to_relationship_record(self, row: sqlite3.Row) -> RelationshipRecord:
         """Convert database row to RelationshipRecord."""
-        return RelationshipRecord(
+        return RelationshipRecord.model_construct(
             id=row["id"],
             source_type=row["source_type"],
             source_id=row["source_id"],
@@ -729,7 +734,7 @@ class DatabaseQuerier:
             target_type=row["target_type"],
             target_id=row["target_id"],
             target_name=row["target_name"],
-            relationship_type=RelationshipType(row["relationship_type"]),
+            relationship_type=row["relationship_type"],
             file_path=row["file_path"],
             line_number=row["line_number"],
             created_at=(
@@ -12,7 +12,9 @@ This module provides automated validation for:
 Run with: python -m pytest tests/validation.py -v
 """
 
+import atexit
 import json
+import logging
 import sqlite3
 
 # Add project root to path
@@ -26,6 +28,13 @@ import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from dashboard.logging_config import setup_logging
+from dashboard.views import (
+    FILE_TABLE_COLUMNS,
+    DashboardState,
+    FileExplorer,
+    SearchPanel,
+)
 from db.populate_db import ASTAnalyzer, DatabasePopulator
 from db.queries import DatabaseQuerier
 
@@ -615,6 +624,195 @@ class TestUser(unittest.TestCase):
         # Domain classification might not work with shortened paths, so this is optional
         # self.assertGreater(len(model_files), 0)  # Commented out for now
 
+    def test_system_stats_refresh_after_database_change(self):
+        """Test that cached system stats are reloaded once the database changes."""
+        populator = DatabasePopulator(self.db_path)
+        populator.create_tables()
+        populator.populate_from_directory(
+            self.project_root,
+            include_patterns=["*.py"],
+            exclude_patterns=["__pycache__"],
+        )
+
+        state = DashboardState(self.db_path)
+        self.assertEqual(state.system_stats.total_files, 3)
+
+        # Remove one file in place; the file size does not change
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("DELETE FROM files WHERE name = 'test_user.py'")
+            conn.commit()
+
+        state.refresh_system_stats()
+        self.assertEqual(state.system_stats.total_files, 2)
+
+    def test_system_stats_missing_database(self):
+        """Test that a missing database leaves system stats unset."""
+        Path(self.db_path).unlink()
+
+        state = DashboardState(self.db_path)
+        self.assertIsNone(state.system_stats)
+
+
+class TestDashboardViews(unittest.TestCase):
+    """Test Panel view components against a test database."""
+
+    def setUp(self):
+        """Set up test database and dashboard state."""
+        self.temp_db = tempfile.NamedTemporaryFile(suffix=".db", delete=False)
+        self.db_path = self.temp_db.name
+        self.temp_db.close()
+
+        DatabasePopulator(self.db_path).create_tables()
+        self.state = DashboardState(self.db_path)
+
+    def tearDown(self):
+        """Clean up test database."""
+        del self.state
+
+        import gc
+
+        gc.collect()
+
+        try:
+            Path(self.db_path).unlink(missing_ok=True)
+        except PermissionError:
+            pass  # Skip cleanup if still locked
+
+    def test_search_results_are_html_escaped(self):
+        """Test that search results and the search term cannot inject markup."""
+        panel = SearchPanel(self.state)
+        payload = "<script>alert(1)</script>"
+        results = {
+            "files": [{"name": payload, "path": payload, "details": payload}],
+            "classes": [],
+            "functions": [],
+        }
+
+        panel.update_results_display(results, "<b>x")
+
+        self.assertNotIn("<script>", panel.results_pane.object)
+        self.assertIn(
+            "&lt;script&gt;alert(1)&lt;/script&gt;", panel.results_pane.object
+        )
+        self.assertNotIn("<b>", panel.results_header.object)
+        self.assertIn("&lt;b&gt;x", panel.results_header.object)
+
+        # The empty-results message echoes the search term as well
+        panel.update_results_display(
+            {"files": [], "classes": [], "functions": []}, "<b>x"
+        )
+        self.assertNotIn("<b>", panel.results_pane.object)
+        self.assertIn("&lt;b&gt;x", panel.results_pane.object)
+
+    def test_short_search_clears_previous_results(self):
+        """Test that a rejected search replaces earlier results and header."""
+        panel = SearchPanel(self.state)
+        results = {
+            "files": [{"name": "user.py", "path": "src/user.py", "details": "python"}],
+            "classes": [{"name": "User", "path": "src/user.py", "details": "class"}],
+            "functions": [],
+        }
+        panel.update_results_display(results, "user")
+        self.assertIn("<h4>Classes (1)</h4>", panel.results_pane.object)
+
+        panel.search_input.value = "u"
+        panel.perform_search(None)
+
+        self.assertEqual(panel.results_header.object, "### Search Results")
+        self.assertEqual(
+            panel.results_pane.object,
+            "<p>Please enter at least 2 characters to search.</p>",
+        )
+
+    def test_files_to_dataframe(self):
+        """Test that queried file records load into the file explorer table."""
+        test_file = FileRecord(
+            name="test.py",
+            path="test/test.py",
+            domain=DomainType.TESTS,
+            file_type=FileType.PYTHON,
+            complexity=5,
+            lines_of_code=100,
+            classes_count=2,
+            functions_count=5,
+            imports_count=3,
+            pydantic_models_count=1,
+        )
+        with sqlite3.connect(self.db_path) as conn:
+            DatabasePopulator(self.db_path)._insert_file_record(
+                conn.cursor(), test_file
+            )
+            conn.commit()
+
+        files, _ = DatabaseQuerier(self.db_path).get_all_files()
+        explorer = FileExplorer(self.state)
+        df = explorer.files_to_dataframe(files)
+
+        self.assertEqual(list(df.columns), FILE_TABLE_COLUMNS)
+        self.assertEqual(len(df), 1)
+        row = df.iloc[0]
+        self.assertEqual(row["domain"], DomainType.TESTS.value)
+        self.assertEqual(row["file_type"], FileType.PYTHON.value)
+        self.assertEqual(row["complexity_level"], test_file.complexity_level)
+        self.assertEqual(len(explorer.files_table.value), 1)
+
+        empty_df = explorer.files_to_dataframe([])
+        self.assertEqual(list(empty_df.columns), FILE_TABLE_COLUMNS)
+        self.assertTrue(empty_df.empty)
+
+
+class TestLoggingSetup(unittest.TestCase):
+    """Test the queued dashboard logging configuration."""
+
+    def setUp(self):
+        """Save the root logger state and create a temporary log directory."""
+        self.root = logging.getLogger()
+        self.saved_handlers = self.root.handlers[:]
+        self.saved_level = self.root.level
+        for handler in self.saved_handlers:
+            self.root.removeHandler(handler)
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.log_file = Path(self.temp_dir.name) / "dashboard.log"
+        self.listener = None
+
+    def tearDown(self):
+        """Stop the listener and restore the root logger."""
+        if self.listener:
+            # Already stopped by the test; drop its exit hook as well
+            atexit.unregister(self.listener.stop)
+            for handler in self.listener.handlers:
+                handler.close()
+        for handler in self.root.handlers[:]:
+            self.root.removeHandler(handler)
+        for handler in self.saved_handlers:
+            self.root.addHandler(handler)
+        self.root.setLevel(self.saved_level)
+        self.temp_dir.cleanup()
+
+    def test_setup_after_panel_serve_logconfig(self):
+        """Test that the queue is installed even when panel serve configured logging."""
+        from logging.handlers import QueueHandler
+
+        from bokeh.util import logconfig
+
+        # panel serve calls this before running app.py
+        logconfig.basicConfig(level=logging.INFO)
+        self.assertTrue(self.root.handlers)
+
+        self.listener = setup_logging(str(self.log_file))
+        self.assertIsNotNone(self.listener)
+        self.assertEqual(len(self.root.handlers), 1)
+        self.assertIsInstance(self.root.handlers[0], QueueHandler)
+
+        # Per-session re-runs must not stack another queue or file handler
+        self.assertIsNone(setup_logging(str(self.log_file)))
+        self.assertEqual(len(self.root.handlers), 1)
+
+        logging.getLogger("dashboard.test").info("queued %s", "message")
+        self.listener.stop()  # Drains the queue
+        self.assertIn("queued message", self.log_file.read_text(encoding="utf-8"))
+
 
 def run_validation_suite():
     """Run the complete validation suite."""
@@ -630,6 +828,8 @@ def run_validation_suite():
     suite.addTests(loader.loadTestsFromTestCase(TestASTAnalysis))
     suite.addTests(loader.loadTestsFromTestCase(TestPydanticModels))
     suite.addTests(loader.loadTestsFromTestCase(TestEndToEndWorkflow))
+    suite.addTests(loader.loadTestsFromTestCase(TestDashboardViews))
+    suite.addTests(loader.loadTestsFromTestCase(TestLoggingSetup))
 
     # Run tests
     runner = unittest.TextTestRunner(verbosity=2)